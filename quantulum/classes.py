@@ -8,6 +8,8 @@
 class Quantity(object):
     """Class for a quantity (e.g. "4.2 gallons")."""
 
+    __slots__ = ('value', 'unit', 'surface', 'span', 'uncertainty')
+
     def __init__(self, value=None, unit=None, surface=None, span=None,
                  uncertainty=None):
         """Initialization method."""
@@ -17,6 +19,15 @@ class Quantity(object):
         self.span = span
         self.uncertainty = uncertainty
 
+    def __getstate__(self):
+        """Pickling method."""
+        return tuple(getattr(self, i) for i in self.__slots__)
+
+    def __setstate__(self, state):
+        """Unpickling method."""
+        for key, val in zip(self.__slots__, state):
+            setattr(self, key, val)
+
     def __repr__(self):
         """Representation method."""
         msg = u'Quantity(%g, "%s")'
@@ -26,7 +37,10 @@ class Quantity(object):
     def __eq__(self, other):
         """Equality method."""
         if isinstance(other, self.__class__):
-            return self.__dict__ == other.__dict__
+            return (self.value, self.unit, self.surface, self.span,
+                    self.uncertainty) == \
+                (other.value, other.unit, other.surface, other.span,
+                 other.uncertainty)
         else:
             return False
 
@@ -39,6 +53,8 @@ class Quantity(object):
 class Unit(object):
     """Class for a unit (e.g. "gallon")."""
 
+    __slots__ = ('name', 'surfaces', 'entity', 'uri', 'symbols', 'dimensions')
+
     def __init__(self, name=None, surfaces=None, entity=None, uri=None,
                  symbols=None, dimensions=None):
         """Initialization method."""
@@ -49,6 +65,15 @@ class Unit(object):
         self.symbols = symbols
         self.dimensions = dimensions
 
+    def __getstate__(self):
+        """Pickling method."""
+        return tuple(getattr(self, i) for i in self.__slots__)
+
+    def __setstate__(self, state):
+        """Unpickling method."""
+        for key, val in zip(self.__slots__, state):
+            setattr(self, key, val)
+
     def __repr__(self):
         """Representation method."""
         msg = u'Unit(name="%s", entity=Entity("%s"), uri=%s)'
@@ -58,7 +83,10 @@ class Unit(object):
     def __eq__(self, other):
         """Equality method."""
         if isinstance(other, self.__class__):
-            return self.__dict__ == other.__dict__
+            return (self.name, self.surfaces, self.entity, self.uri,
+                    self.symbols, self.dimensions) == \
+                (other.name, other.surfaces, other.entity, other.uri,
+                 other.symbols, other.dimensions)
         else:
             return False
 
@@ -71,12 +99,23 @@ class Unit(object):
 class Entity(object):
     """Class for an entity (e.g. "volume")."""
 
+    __slots__ = ('name', 'dimensions', 'uri')
+
     def __init__(self, name=None, dimensions=None, uri=None):
         """Initialization method."""
         self.name = name
         self.dimensions = dimensions
         self.uri = uri
 
+    def __getstate__(self):
+        """Pickling method."""
+        return tuple(getattr(self, i) for i in self.__slots__)
+
+    def __setstate__(self, state):
+        """Unpickling method."""
+        for key, val in zip(self.__slots__, state):
+            setattr(self, key, val)
+
     def __repr__(self):
         """Representation method."""
         msg = u'Entity(name="%s", uri=%s)'
@@ -86,7 +125,8 @@ class Entity(object):
     def __eq__(self, other):
         """Equality method."""
         if isinstance(other, self.__class__):
-            return self.__dict__ == other.__dict__
+            return (self.name, self.dimensions, self.uri) == \
+                (other.name, other.dimensions, other.uri)
         else:
             return False
 
@@ -114,6 +114,28 @@ if USE_CLF:
 else:
     TFIDF_MODEL, CLF, TARGET_NAMES = None, None, None
 
+# Scores of the last few texts, as the same text is used for every ambiguity
+_SCORES_CACHE = {}
+
+
+###############################################################################
+def get_scores(text, clean=False):
+    """Get the classifier scores of all units and entities for a text."""
+    key = (text, clean)
+    scores = _SCORES_CACHE.get(key)
+
+    if scores is None:
+        if len(_SCORES_CACHE) > 3:
+            _SCORES_CACHE.clear()
+        transformed = TFIDF_MODEL.transform([clean_text(text) if clean else
+                                             text])
+        scores = CLF.predict_proba(transformed).tolist()[0]
+        scores = sorted(zip(scores, TARGET_NAMES), key=lambda x: x[0],
+                        reverse=True)
+        _SCORES_CACHE[key] = scores
+
+    return scores
+
 
 ###############################################################################
 def disambiguate_entity(key, text):
@@ -121,10 +143,7 @@ def disambiguate_entity(key, text):
     new_ent = l.DERIVED_ENT[key][0]
 
     if len(l.DERIVED_ENT[key]) > 1:
-        transformed = TFIDF_MODEL.transform([text])
-        scores = CLF.predict_proba(transformed).tolist()[0]
-        scores = sorted(zip(scores, TARGET_NAMES), key=lambda x: x[0],
-                        reverse=True)
+        scores = get_scores(text)
         names = [i.name for i in l.DERIVED_ENT[key]]
         scores = [i for i in scores if i[1] in names]
         try:
@@ -149,10 +168,7 @@ def disambiguate_unit(unit, text):
             raise KeyError('Could not find unit "%s"' % unit)
 
     if len(new_unit) > 1:
-        transformed = TFIDF_MODEL.transform([clean_text(text)])
-        scores = CLF.predict_proba(transformed).tolist()[0]
-        scores = sorted(zip(scores, TARGET_NAMES), key=lambda x: x[0],
-                        reverse=True)
+        scores = get_scores(text, clean=True)
         names = [i.name for i in new_unit]
         scores = [i for i in scores if i[1] in names]
         try:
@@ -6,8 +6,10 @@
 # Standard library
 import re
 import logging
+import multiprocessing
+from bisect import bisect_right
+from functools import partial
 from fractions import Fraction
-from collections import defaultdict
 
 # Quantulum
 from . import load as l
@@ -15,54 +17,142 @@ from . import regex as r
 from . import classes as c
 from . import classifier as clf
 
+_FRACS_RE = re.compile(r'|'.join(r.UNI_FRAC), re.IGNORECASE)
+_MULTIPLIERS_RE = re.compile(ur'(?<=\d)(%s)10' % r.MULTIPLIERS)
+_SPACES_RE = re.compile(' +')
+_TRAIL_DASH_RE = re.compile(r'-$')
+_RANGE_SEP_RE = re.compile(ur'\d+ ?(?P<range>-|and|(?:- ?)?to) ?\d')
+_UNCER_SEP_RE = re.compile(ur'\d+ ?(?P<uncer>\+/-|±) ?\d')
+_VAL_SEP_RE = re.compile(ur'%s|%s|(?P<fract>\d+/\d+)' % (_RANGE_SEP_RE.pattern,
+                                                        _UNCER_SEP_RE.pattern))
+_SPELLOUT_COMBO = re.compile(ur'(?P<spell>%s)|(?P<comma>\d+(?:,\d{3})+)' %
+                             r.REG_TXT.pattern, re.VERBOSE | re.IGNORECASE)
+_TOKEN_RE = re.compile(r'[a-zA-Z0-9_]+')
+_DIGIT_START = frozenset('0123456789.+-')
+_POWER_FIND_RE = re.compile(r'\-?[0-9%s]+' % r.SUPERSCRIPTS)
+_SUPER_STRIP_RE = re.compile(r'\^?\-?[0-9%s]+' % r.SUPERSCRIPTS)
+_CUBED_RE = re.compile(r'\bcubed\b')
+_SQUARED_RE = re.compile(r'\bsquared\b')
+_QUOTE_RE = re.compile(r'("|\')[^ .,:;?!()*+-].*?("|\')')
+_ORDINAL_CODE_RE = re.compile(r'1st|2nd|3rd|[04-9]th|\d+[A-Z]+\d+')
+_SECOND_RE = re.compile(r'\ba second\b')
+_SUFFIX_RE = re.compile(r'\d(K|M|B|T)\b(.*?)$')
+_SUFFIX_SET = frozenset(r.SUFFIXES)
+_WORD = re.compile(r'\w').match
+_DECADE_RE = re.compile(r'[1-2]\d\d0s')
+_INCH_RE = re.compile(r' in$')
+_TIME_RE = re.compile(r' time$')
+_GENITIVE_RE = re.compile(r'(?<=\w)\'s\b|(?<=\w)s\'(?!\w)')
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Groups of REG_DIM with units (the prefix included) and with operators
+_UNIT_GROUPS = (1, 4, 6, 8, 10)
+_OPERATOR_GROUPS = (3, 5, 7, 9)
+_SORTED_GROUPS = sorted(_UNIT_GROUPS + _OPERATOR_GROUPS)
+
+# Nasty unicode characters and their ASCII equivalent
+_CLEAN_CHARS = ((u'×', u'x'), (u'–', u'-'), (u'−', u'-'))
+
+# Units and entities inferred from dimensions, keyed on the dimensions key
+_UNIT_CACHE = {}
+_ENT_CACHE = {}
+
 
 ###############################################################################
 def clean_surface(surface, span):
     """Remove spurious characters from a quantity's surface."""
     surface = surface.replace('-', ' ')
-    no_start = ['and', ' ']
-    no_end = [' and', ' ']
-
-    found = True
-    while found:
-        found = False
-        for word in no_start:
-            if surface.lower().startswith(word):
-                surface = surface[len(word):]
-                span = (span[0] + len(word), span[1])
-                found = True
-        for word in no_end:
-            if surface.lower().endswith(word):
-                surface = surface[:-len(word)]
-                span = (span[0], span[1] - len(word))
-                found = True
+
+    length = None
+    while length != len(surface):
+        length = len(surface)
+        stripped = surface.lstrip(' ')
+        if stripped[:3].lower() == 'and':
+            stripped = stripped[3:]
+        span = (span[0] + len(surface) - len(stripped), span[1])
+        surface = stripped.rstrip(' ')
+        if surface[-4:].lower() == ' and':
+            surface = surface[:-4]
+        span = (span[0], span[1] - len(stripped) + len(surface))
 
     if not surface:
         return None, None
 
     split = surface.lower().split()
-    if split[0] in ['one', 'a', 'an'] and len(split) > 1 and split[1] in \
-            r.UNITS + r.TENS:
-        span = (span[0] + len(surface.split()[0]) + 1, span[1])
-        surface = ' '.join(surface.split()[1:])
+    if split[0] in ['one', 'a', 'an'] and len(split) > 1 and \
+            (split[1] in r.UNITS or split[1] in r.TENS):
+        words = surface.split()
+        span = (span[0] + len(words[0]) + 1, span[1])
+        surface = ' '.join(words[1:])
 
     return surface, span
 
 
+###############################################################################
+def get_spellout_starts(text):
+    """
+    Find where spelled out or comma-grouped numbers can start.
+
+    Yield the position of each number word and digit run, along with how many
+    characters before it a match can start (a separator, a sign or a dot).
+    """
+    for token in _TOKEN_RE.finditer(text):
+        word = token.group(0)
+        if word.lower() in r.NUMWORDS:
+            yield token.start(), 1
+        elif not word.isalpha():
+            for digits in r.REG_DIGITS.finditer(text, token.start(),
+                                                token.end()):
+                yield digits.start(), 2
+
+
+###############################################################################
+def finditer_spellout(text):
+    """
+    Iterate over the matches of spelled out and comma-grouped numbers.
+
+    Same as _SPELLOUT_COMBO.finditer(text), but only try the positions found
+    by get_spellout_starts instead of every position of the text.
+    """
+    pos = 0
+    for start, before in get_spellout_starts(text):
+        if start < pos:
+            continue
+        for idx in xrange(max(pos, start - before), start + 1):
+            item = _SPELLOUT_COMBO.match(text, idx)
+            if item:
+                break
+        else:
+            pos = start + 1
+            continue
+        # A comma-grouped number can follow in the middle of a digit run
+        while item:
+            yield item
+            pos = item.end()
+            item = r.REG_DIGITS.match(text, pos) and \
+                _SPELLOUT_COMBO.match(text, pos)
+
+
 ###############################################################################
 def extract_spellout_values(text):
     """Convert spelled out numbers in a given text to digits."""
     values = []
-    for item in r.REG_TXT.finditer(text):
+    for item in finditer_spellout(text):
+        if item.group('comma'):
+            values.append({'old_surface': item.group(0),
+                           'old_span': item.span(),
+                           'new_surface': unicode(item.group(0).replace(',',
+                                                                        ''))})
+            continue
         surface, span = clean_surface(item.group(0), item.span())
         if not surface or surface.lower() in r.SCALES:
             continue
         curr = result = 0.0
-        for word in surface.split():
-            try:
-                scale, increment = 1, float(word.lower())
-            except ValueError:
-                scale, increment = r.NUMWORDS[word.lower()]
+        for word in surface.lower().split():
+            if word[:1] in _DIGIT_START:
+                scale, increment = 1, float(word)
+            else:
+                scale, increment = r.NUMWORDS[word]
             curr = curr * scale + increment
             if scale > 100:
                 result += curr
@@ -71,32 +161,37 @@ def extract_spellout_values(text):
                        'old_span': span,
                        'new_surface': unicode(result + curr)})
 
-    for item in re.finditer(r'\d+(,\d{3})+', text):
-        values.append({'old_surface': item.group(0),
-                       'old_span': item.span(),
-                       'new_surface': unicode(item.group(0).replace(',', ''))})
-
-    return sorted(values, key=lambda x: x['old_span'][0])
+    return values
 
 
 ###############################################################################
 def substitute_values(text, values):
     """Convert spelled out numbers in a given text to digits."""
-    shift, final_text, shifts = 0, text, defaultdict(int)
+    shift, cursor, parts, shifts = 0, 0, [], []
     for value in values:
-        first = value['old_span'][0] + shift
-        second = value['old_span'][1] + shift
+        first, second = value['old_span']
         new_s = value['new_surface']
-        final_text = final_text[0:first] + new_s + final_text[second:]
-        shift += len(new_s) - len(value['old_surface'])
-        for char in range(first + 1, len(final_text)):
-            shifts[char] = shift
+        parts += [text[cursor:first], new_s]
+        cursor = second
+        delta = len(new_s) - (second - first)
+        first += shift
+        shift += delta
+        shifts.append((first, shift))
+    parts.append(text[cursor:])
+    final_text = u''.join(parts)
 
     logging.debug(u'Text after numeric conversion: "%s"', final_text)
 
     return final_text, shifts
 
 
+###############################################################################
+def get_shift(shifts, pos):
+    """Get the shift of a position in the text after numeric conversion."""
+    idx = bisect_right(shifts, (pos,)) - 1
+    return 0 if idx < 0 else shifts[idx][1]
+
+
 ###############################################################################
 def callback(pattern):
     """Regex callback function."""
@@ -106,33 +201,34 @@ def callback(pattern):
 ###############################################################################
 def get_values(item):
     """Extract value from regex hit."""
-    fracs = r'|'.join(r.UNI_FRAC)
-
     value = item.group(2)
-    value = re.sub(ur'(?<=\d)(%s)10' % r.MULTIPLIERS, 'e', value)
-    value = re.sub(fracs, callback, value, re.IGNORECASE)
-    value = re.sub(' +', ' ', value)
+    value = _MULTIPLIERS_RE.sub('e', value)
+    value = _FRACS_RE.sub(callback, value)
+    value = _SPACES_RE.sub(' ', value)
 
-    range_separator = re.findall(ur'\d+ ?(-|and|(?:- ?)?to) ?\d', value)
-    uncer_separator = re.findall(ur'\d+ ?(\+/-|±) ?\d', value)
-    fract_separator = re.findall(ur'\d+/\d+', value)
+    separator = _VAL_SEP_RE.search(value)
+    if separator and separator.lastgroup != 'range':
+        # Ranges, then uncertainties, win over separators found earlier on
+        separator = (_RANGE_SEP_RE.search(value) or
+                     _UNCER_SEP_RE.search(value) or separator)
+    kind = separator.lastgroup if separator else None
 
     uncertainty = None
-    if range_separator:
-        values = value.split(range_separator[0])
-        values = [float(re.sub(r'-$', '', i)) for i in values]
-    elif uncer_separator:
-        values = [float(i) for i in value.split(uncer_separator[0])]
+    if kind == 'range':
+        values = value.split(separator.group('range'))
+        values = [float(_TRAIL_DASH_RE.sub('', i)) for i in values]
+    elif kind == 'uncer':
+        values = [float(i) for i in value.split(separator.group('uncer'))]
         uncertainty = values[1]
         values = [values[0]]
-    elif fract_separator:
+    elif kind == 'fract':
         values = value.split()
         if len(values) > 1:
             values = [float(values[0]) + float(Fraction(values[1]))]
         else:
             values = [float(Fraction(values[0]))]
     else:
-        values = [float(re.sub(r'-$', '', value))]
+        values = [float(_TRAIL_DASH_RE.sub('', value))]
 
     logging.debug(u'\tUncertainty: %s', uncertainty)
     logging.debug(u'\tValues: %s', values)
@@ -171,6 +267,9 @@ def get_unit_from_dimensions(dimensions, text):
     """Reconcile a unit based on its dimensionality."""
     key = l.get_key_from_dimensions(dimensions)
 
+    if key in _UNIT_CACHE:
+        return _UNIT_CACHE[key]
+
     try:
         unit = l.DERIVED_UNI[key]
     except KeyError:
@@ -179,6 +278,10 @@ def get_unit_from_dimensions(dimensions, text):
                       dimensions=dimensions,
                       entity=get_entity_from_dimensions(dimensions, text))
 
+    # The entity is only cached when it does not depend on the text
+    if key in l.DERIVED_UNI or key in _ENT_CACHE:
+        _UNIT_CACHE[key] = unit
+
     return unit
 
 
@@ -189,6 +292,11 @@ def get_entity_from_dimensions(dimensions, text):
 
     Just based on the unit's dimensionality if the classifier is disabled.
     """
+    cache_key = l.get_key_from_dimensions(dimensions)
+
+    if cache_key in _ENT_CACHE:
+        return _ENT_CACHE[cache_key]
+
     new_dimensions = [{'base': l.NAMES[i['base']].entity.name,
                        'power': i['power']} for i in dimensions]
 
@@ -204,6 +312,10 @@ def get_entity_from_dimensions(dimensions, text):
         logging.debug(u'\tCould not find entity for: %s', key)
         ent = c.Entity(name='unknown', dimensions=new_dimensions)
 
+    # Ambiguous entities are resolved by the classifier based on the text
+    if not clf.USE_CLF or len(l.DERIVED_ENT[key]) < 2:
+        _ENT_CACHE[cache_key] = ent
+
     return ent
 
 
@@ -211,22 +323,22 @@ def get_entity_from_dimensions(dimensions, text):
 def parse_unit(item, group, slash):
     """Parse surface and power from unit text."""
     surface = item.group(group).replace('.', '')
-    power = re.findall(r'\-?[0-9%s]+' % r.SUPERSCRIPTS, surface)
+    power = _POWER_FIND_RE.findall(surface)
 
     if power:
         power = [r.UNI_SUPER[i] if i in r.UNI_SUPER else i for i
                  in power]
         power = ''.join(power)
         new_power = (-1 * int(power) if slash else int(power))
-        surface = re.sub(r'\^?\-?[0-9%s]+' % r.SUPERSCRIPTS, '', surface)
+        surface = _SUPER_STRIP_RE.sub('', surface)
 
-    elif re.findall(r'\bcubed\b', surface):
+    elif _CUBED_RE.findall(surface):
         new_power = (-3 if slash else 3)
-        surface = re.sub(r'\bcubed\b', '', surface).strip()
+        surface = _CUBED_RE.sub('', surface).strip()
 
-    elif re.findall(r'\bsquared\b', surface):
+    elif _SQUARED_RE.findall(surface):
         new_power = (-2 if slash else 2)
-        surface = re.sub(r'\bsquared\b', '', surface).strip()
+        surface = _SQUARED_RE.sub('', surface).strip()
 
     else:
         new_power = (-1 if slash else 1)
@@ -237,19 +349,16 @@ def parse_unit(item, group, slash):
 ###############################################################################
 def get_unit(item, text):
     """Extract unit from regex hit."""
-    group_units = [1, 4, 6, 8, 10]
-    group_operators = [3, 5, 7, 9]
-
-    item_units = [item.group(i) for i in group_units if item.group(i)]
+    groups = item.groups()
 
-    if len(item_units) == 0:
+    if not any(groups[i - 1] for i in _UNIT_GROUPS):
         unit = l.NAMES['dimensionless']
     else:
         dimensions, slash = [], False
-        for group in sorted(group_units + group_operators):
-            if not item.group(group):
+        for group in _SORTED_GROUPS:
+            if not groups[group - 1]:
                 continue
-            if group in group_units:
+            if group in _UNIT_GROUPS:
                 surface, power = parse_unit(item, group, slash)
                 if clf.USE_CLF:
                     base = clf.disambiguate_unit(surface, text).name
@@ -257,7 +366,7 @@ def get_unit(item, text):
                     base = l.UNITS[surface][0].name
                 dimensions += [{'base': base, 'power': power}]
             elif not slash:
-                slash = any(i in item.group(group) for i in [u'/', u' per '])
+                slash = any(i in groups[group - 1] for i in [u'/', u' per '])
 
         unit = get_unit_from_dimensions(dimensions, text)
 
@@ -273,43 +382,36 @@ def get_surface(shifts, orig_text, item, text):
     span = item.span()
     logging.debug(u'\tInitial span: %s ("%s")', span, text[span[0]:span[1]])
 
-    real_span = (span[0] - shifts[span[0]], span[1] - shifts[span[1] - 1])
+    real_span = (span[0] - get_shift(shifts, span[0]),
+                 span[1] - get_shift(shifts, span[1] - 1))
     surface = orig_text[real_span[0]:real_span[1]]
     logging.debug(u'\tShifted span: %s ("%s")', real_span, surface)
 
-    while any(surface.endswith(i) for i in [' ', '-']):
-        surface = surface[:-1]
-        real_span = (real_span[0], real_span[1] - 1)
-
-    while surface.startswith(' '):
-        surface = surface[1:]
-        real_span = (real_span[0] + 1, real_span[1])
+    stripped = surface.rstrip(' -')
+    real_span = (real_span[0], real_span[1] - len(surface) + len(stripped))
+    surface = stripped.lstrip(' ')
+    real_span = (real_span[0] + len(stripped) - len(surface), real_span[1])
 
     logging.debug(u'\tFinal span: %s ("%s")', real_span, surface)
     return surface, real_span
 
 
 ###############################################################################
-def is_quote_artifact(orig_text, span):
-    """Distinguish between quotes and units."""
-    res = False
-    cursor = re.finditer(r'("|\')[^ .,:;?!()*+-].*?("|\')', orig_text)
-
-    for item in cursor:
-        if item.span()[1] == span[1]:
-            res = True
-
-    return res
+def get_quote_ends(text):
+    """Get the end of all quotes, to distinguish between quotes and units."""
+    return set(item.end() for item in _QUOTE_RE.finditer(text))
 
 
 ###############################################################################
-def build_quantity(orig_text, text, item, values, unit, surface, span, uncert):
+def build_quantity(orig_text, quote_ends, item, values, unit, surface, span,
+                   uncert):
     """Build a Quantity object out of extracted information."""
+    surf_lo = surface.lower()
+
     # Discard irrelevant txt2float extractions, cardinal numbers, codes etc.
-    if surface.lower() in ['a', 'an', 'one'] or \
-            re.search(r'1st|2nd|3rd|[04-9]th', surface) or \
-            re.search(r'\d+[A-Z]+\d+', surface) or \
-            re.search(r'\ba second\b', surface, re.IGNORECASE):
+    if surf_lo in ('a', 'an', 'one') or \
+            _ORDINAL_CODE_RE.search(surface) or \
+            ('second' in surf_lo and _SECOND_RE.search(surf_lo)):
         logging.debug(u'\tMeaningless quantity ("%s"), discard', surface)
         return
 
@@ -317,29 +419,26 @@ def build_quantity(orig_text, text, item, values, unit, surface, span, uncert):
     elif unit.entity.dimensions and \
             unit.entity.dimensions[0]['base'] == 'currency':
         if len(unit.dimensions) > 1:
-            try:
-                suffix = re.findall(r'\d(K|M|B|T)\b(.*?)$', surface)[0]
-                values = [i * r.SUFFIXES[suffix[0]] for i in values]
+            suffix = _SUFFIX_RE.search(surface)
+            if suffix:
+                values = [i * r.SUFFIXES[suffix.group(1)] for i in values]
                 unit = l.UNITS[unit.dimensions[0]['base']][0]
-                if suffix[1]:
-                    surface = surface[:surface.find(suffix[1])]
-                    span = (span[0], span[1] - len(suffix[1]))
+                if suffix.group(2):
+                    surface = surface[:suffix.end(1)]
+                    span = (span[0], span[1] - len(suffix.group(2)))
                 logging.debug(u'\tCorrect for "$3T" pattern')
-            except IndexError:
-                pass
         else:
-            try:
-                suffix = re.findall(r'%s(K|M|B|T)\b' % re.escape(surface),
-                                    orig_text)[0]
+            # Look at the character right after the quantity only, instead
+            # of searching the whole text for the surface + suffix
+            suffix = orig_text[span[1]:span[1] + 1]
+            if suffix in _SUFFIX_SET and not _WORD(orig_text, span[1] + 1):
                 surface += suffix
                 span = (span[0], span[1] + 1)
                 values = [i * r.SUFFIXES[suffix] for i in values]
                 logging.debug(u'\tCorrect for "$3T" pattern')
-            except IndexError:
-                pass
 
     # Usually "1990s" stands for the decade, not the amount of seconds
-    elif re.match(r'[1-2]\d\d0s', surface):
+    elif _DECADE_RE.match(surface):
         unit = l.NAMES['dimensionless']
         surface = surface[:-1]
         span = (span[0], span[1] - 1)
@@ -347,7 +446,7 @@ def build_quantity(orig_text, text, item, values, unit, surface, span, uncert):
 
     # Usually "in" stands for the preposition, not inches
     elif unit.dimensions[-1]['base'] == 'inch' and \
-            re.search(r' in$', surface) and '/' not in surface:
+            _INCH_RE.search(surface) and '/' not in surface:
         if len(unit.dimensions) > 1:
             unit = get_unit_from_dimensions(unit.dimensions[:-1], orig_text)
         else:
@@ -356,7 +455,7 @@ def build_quantity(orig_text, text, item, values, unit, surface, span, uncert):
         span = (span[0], span[1] - 3)
         logging.debug(u'\tCorrect for "in" pattern')
 
-    elif is_quote_artifact(text, item.span()):
+    elif item.end() in quote_ends:
         if len(unit.dimensions) > 1:
             unit = get_unit_from_dimensions(unit.dimensions[:-1], orig_text)
         else:
@@ -365,7 +464,7 @@ def build_quantity(orig_text, text, item, values, unit, surface, span, uncert):
         span = (span[0], span[1] - 1)
         logging.debug(u'\tCorrect for quotes')
 
-    elif re.search(r' time$', surface) and len(unit.dimensions) > 1 and \
+    elif _TIME_RE.search(surface) and len(unit.dimensions) > 1 and \
             unit.dimensions[-1]['base'] == 'count':
         unit = get_unit_from_dimensions(unit.dimensions[:-1], orig_text)
         surface = surface[:-5]
@@ -388,12 +487,11 @@ def build_quantity(orig_text, text, item, values, unit, surface, span, uncert):
 def clean_text(text):
     """Clean text before parsing."""
     # Replace a few nasty unicode characters with their ASCII equivalent
-    maps = {u'×': u'x', u'–': u'-', u'−': '-'}
-    for element in maps:
-        text = text.replace(element, maps[element])
+    for char, ascii_char in _CLEAN_CHARS:
+        text = text.replace(char, ascii_char)
 
     # Replace genitives
-    text = re.sub(r'(?<=\w)\'s\b|(?<=\w)s\'(?!\w)', '  ', text)
+    text = _GENITIVE_RE.sub('  ', text)
 
     logging.debug(u'Clean text: "%s"', text)
 
@@ -422,9 +520,10 @@ def parse(text, verbose=False):
     text = clean_text(text)
     values = extract_spellout_values(text)
     text, shifts = substitute_values(text, values)
+    quote_ends = get_quote_ends(text)
 
     quantities = []
-    for item in r.REG_DIM.finditer(text):
+    for item in r.finditer_dim(text):
 
         groups = dict([i for i in item.groupdict().items() if i[1] and
                        i[1].strip()])
@@ -437,8 +536,8 @@ def parse(text, verbose=False):
 
         unit = get_unit(item, text)
         surface, span = get_surface(shifts, orig_text, item, text)
-        objs = build_quantity(orig_text, text, item, values, unit, surface,
-                              span, uncert)
+        objs = build_quantity(orig_text, quote_ends, item, values, unit,
+                              surface, span, uncert)
         if objs is not None:
             quantities += objs
 
@@ -456,11 +555,74 @@ def inline_parse(text, verbose=False):
 
     parsed = parse(text, verbose=verbose)
 
-    shift = 0
+    cursor, parts = 0, []
     for quantity in parsed:
-        index = quantity.span[1] + shift
-        to_add = u' {' + unicode(quantity) + u'}'
-        text = text[0:index] + to_add + text[index:]
-        shift += len(to_add)
+        index = quantity.span[1]
+        parts += [text[cursor:index], u' {' + unicode(quantity) + u'}']
+        cursor = index
+    parts.append(text[cursor:])
 
-    return text
+    return u''.join(parts)
+
+
+###############################################################################
+def get_chunks(text, chunk_size, probe=64):
+    """
+    Split a text into chunks of at least chunk_size characters.
+
+    Split only at sentence boundaries not crossed by a quantity or a quote,
+    looking for quantities within probe characters around the boundary.
+    Return a list of (start, chunk) tuples.
+    """
+    quotes = [item.span() for item in _QUOTE_RE.finditer(text)]
+    chunks, start = [], 0
+    for item in _SENTENCE_END_RE.finditer(text):
+        if item.end() - start < chunk_size:
+            continue
+        idx = bisect_right(quotes, (item.end(),)) - 1
+        if idx >= 0 and quotes[idx][1] > item.end():
+            continue
+        offset = max(start, item.start() - probe)
+        window = text[offset:item.end() + probe]
+        quants = r.finditer_dim(window)
+        if any(i.start() < item.end() - offset and
+               i.end() > item.start() - offset for i in quants):
+            continue
+        chunks.append((start, text[start:item.end()]))
+        start = item.end()
+    chunks.append((start, text[start:]))
+
+    return chunks
+
+
+###############################################################################
+def parse_parallel(text, chunk_size=10000, processes=None, verbose=False):
+    """
+    Extract all quantities from unstructured text, using several processes.
+
+    The text is split at sentence boundaries into chunks parsed separately,
+    so ambiguous units are resolved with their chunk as context.
+    """
+    if isinstance(text, str):
+        text = text.decode('utf-8')
+
+    chunks = get_chunks(text, chunk_size)
+    if len(chunks) < 2:
+        return parse(text, verbose)
+
+    pool = multiprocessing.Pool(processes)
+    try:
+        results = pool.map(partial(parse, verbose=verbose),
+                           [i[1] for i in chunks])
+    finally:
+        pool.close()
+        pool.join()
+
+    quantities = []
+    for (start, _), parsed in zip(chunks, results):
+        for quantity in parsed:
+            quantity.span = (quantity.span[0] + start,
+                             quantity.span[1] + start)
+        quantities += parsed
+
+    return quantities
@@ -100,6 +100,12 @@ TXT_PATTERN = ur'''            # Pattern for extracting mixed digit-spelled num
 
 REG_TXT = re.compile(TXT_PATTERN, re.VERBOSE | re.IGNORECASE)
 
+# A quantity needs a digit right after its optional prefix (currency symbol)
+# and sign or decimal point, so it starts at most this far from a digit
+DIGIT_WINDOW = max(len(i) for i in l.SYMBOLS) + 2
+
+REG_DIGITS = re.compile(r'\d+')
+
 
 ###############################################################################
 def get_units_regex():
@@ -117,6 +123,7 @@ def get_units_regex():
 
     pattern = ur'''
 
+        (?=\D{0,%d}\d)                          # Fail fast, no digit ahead
         (?P<prefix>(?:%s)(?![a-zA-Z]))?         # Currencies, mainly
         (?P<value>%s)-?                           # Number
         (?:(?P<operator1>%s)?(?P<unit1>(?:%s)%s)?)    # Operator + Unit (1)
@@ -124,11 +131,34 @@ def get_units_regex():
         (?:(?P<operator3>%s)?(?P<unit3>(?:%s)%s)?)    # Operator + Unit (3)
         (?:(?P<operator4>%s)?(?P<unit4>(?:%s)%s)?)    # Operator + Unit (4)
 
-    ''' % tuple([all_symbols, RAN_PATTERN] + 4 * [all_ops, all_units,
-                                                  exponent])
+    ''' % tuple([DIGIT_WINDOW, all_symbols, RAN_PATTERN] +
+                4 * [all_ops, all_units, exponent])
 
     regex = re.compile(pattern, re.VERBOSE | re.IGNORECASE)
 
     return regex
 
 REG_DIM = get_units_regex()
+
+
+###############################################################################
+def finditer_dim(text):
+    """
+    Iterate over the matches of REG_DIM in a text.
+
+    Same as REG_DIM.finditer(text), but only try the positions right before
+    a number instead of every position of the text.
+    """
+    pos = 0
+    for digits in REG_DIGITS.finditer(text):
+        start = digits.start()
+        if start < pos:
+            continue
+        for idx in xrange(max(pos, start - DIGIT_WINDOW), start + 1):
+            item = REG_DIM.match(text, idx)
+            if item:
+                yield item
+                pos = item.end()
+                break
+        else:
+            pos = start + 1
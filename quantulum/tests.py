@@ -7,6 +7,7 @@
 import os
 import re
 import json
+import pickle
 import unittest
 
 # Dependencies
@@ -28,12 +29,15 @@ def embed_text(quants, beg_char, chunk, content):
     if quants:
         end_char = max((chunk + 1) * 1000, quants[-1].span[1])
         text = content[beg_char:end_char]
-        shift = 0
+        start, end = COLOR2.split('%s')
+        cursor, parts = 0, []
         for quantity in quants:
-            index = quantity.span[1] - beg_char + shift
-            to_add = COLOR1 % (' {' + str(quantity) + '}')
-            text = text[0:index] + to_add + COLOR2 % text[index:]
-            shift += len(to_add) + len(COLOR2) - 6
+            index = quantity.span[1] - beg_char
+            parts += [text[cursor:index],
+                      COLOR1 % (' {' + str(quantity) + '}'), start]
+            cursor = index
+        parts += [text[cursor:], end * len(quants)]
+        text = ''.join(parts)
     else:
         end_char = (chunk + 1) * 1000
         text = content[beg_char:end_char]
@@ -149,6 +153,18 @@ class EndToEndTests(unittest.TestCase):
         for test in sorted(all_tests, key=lambda x: len(x['req'])):
             self.assertEqual(p.parse(test['req']), test['res'])
 
+    def test_pickle(self):
+        """Test for pickling parsed quantities."""
+        quants = p.parse(u'I want 2 liters of wine')
+        self.assertEqual(pickle.loads(pickle.dumps(quants, 0)), quants)
+
+    def test_parse_parallel(self):
+        """Test for parser.parse_parallel() function."""
+        text = (u'The bar is 5 kilometres long! It weighs 3 kilograms. '
+                u'It costs between 2 and 4 dollars.\n') * 40
+        self.assertEqual(p.parse_parallel(text, chunk_size=100),
+                         p.parse(text))
+
 
 ###############################################################################
 if __name__ == '__main__':